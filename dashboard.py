@@ -6,15 +6,23 @@ It requires an enterprise API key to access the synchronizers endpoint."""
 
 import argparse
 import asyncio
+import hashlib
+import json
+import os
 import sys
-import time
-from typing import Any, Dict, List
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple
 
 import httpx
 from rich.console import RenderableType
 from rich.table import Table
+from rich.text import Text
 from textual.app import App
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Static
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -34,26 +42,144 @@ try:
 except ImportError:
     TextualHeader = None  # type: ignore
 
+try:  # C decoder, several times faster than the stdlib one
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:  # Python ≥ 3.12
+    from itertools import batched
+except ImportError:
+    def batched(iterable, n):  # type: ignore[no-redef]
+        it = iter(iterable)
+        while chunk := tuple(islice(it, n)):
+            yield chunk
+
 # ──────────────────────────────────────────────────────────────────────────────
 API_URL = "https://startsynqing.com/api/synq-keys/enterprise/synchronizers"
 REFRESH_EVERY = 60  # seconds
+REFRESH_MAX = 600  # backoff cap while the synchronizer set stays unchanged
+CARDS_PER_ROW = 3
 APP_TITLE = "Synchronizers Dashboard"
+# The only synchronizer fields kept after parsing, in card row order
+_SYNC_FIELDS = ("id", "key", "name", "isEnabled")
+# (field, pre-styled label) for each row of a synchronizer card
+_FIELDS: tuple[tuple[str, Text], ...] = tuple((field, Text(field, style="bold")) for field in _SYNC_FIELDS)
+# Sort synchronizers by 'name' (change 'name' to another key if needed)
+_SYNC_SORT_KEY = itemgetter("name")
+CACHE_DIR = Path.home() / ".cache" / "multisynq"
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
-async def fetch_synchronizers(client: httpx.AsyncClient, key: str) -> tuple[List[Dict[str, Any]], str | None]:
-    """Return (list_of_syncs, wallet) or ([], None) on error."""
-    headers = {"X-Enterprise-API-Key": key, "Content-Type": "application/json"}
+class SyncCache:
+    """Validators and last payload for one API key, persisted in CACHE_DIR."""
+
+    def __init__(self, key: str) -> None:
+        # The key itself never touches the disk – only a digest of it.
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        self.path = CACHE_DIR / f"synchronizers-{digest}.json"
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self.digest: str | None = None
+        self.syncs: List[Dict[str, Any]] | None = None
+        self.wallet: str | None = None
+        self.load()
+
+    def load(self) -> None:
+        """Restore state from disk; a missing or corrupt file is ignored."""
+        try:
+            with self.path.open(encoding="utf-8") as fh:
+                data = json.load(fh)
+            self.etag = data.get("etag")
+            self.last_modified = data.get("last_modified")
+            self.digest = data.get("digest")
+            self.syncs = data.get("synchronizers")
+            self.wallet = data.get("wallet")
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def save(self) -> None:
+        data = {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "digest": self.digest,
+            "synchronizers": self.syncs,
+            "wallet": self.wallet,
+        }
+        # Payload holds synchronizer keys and the wallet: owner-only access
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.unlink(missing_ok=True)  # so the mode below always applies
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            tmp.replace(self.path)
+        except OSError as exc:  # pragma: no cover
+            print(f"[cache] {type(exc).__name__}: {exc}", file=sys.stderr)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for the cached payload, if any."""
+        if self.syncs is None:
+            return {}
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _project(sync: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the displayed fields, guaranteeing the sort key exists."""
+    card = {field: sync[field] for field in _SYNC_FIELDS if field in sync}
+    if card.get("name") is None:
+        card["name"] = ""
+    return card
+
+
+class FetchResult(NamedTuple):
+    """Outcome of one fetch_synchronizers call."""
+
+    syncs: List[Dict[str, Any]]
+    wallet: str | None
+    changed: bool  # False when the cached payload was reused
+    ok: bool  # False when the request failed and the result is stale
+
+
+async def fetch_synchronizers(client: httpx.AsyncClient, cache: SyncCache) -> FetchResult:
+    """Return the synchronizers (sorted by name) and wallet for the client's key.
+
+    The client carries the API key header (see Dashboard.__init__). A 304, or
+    a body identical to the cached one, returns the cached result with
+    changed=False and skips JSON decoding. On error the last good result is
+    returned with ok=False (or an empty one if there is none)."""
     try:
-        resp = await client.get(API_URL, headers=headers, timeout=10)
+        resp = await client.get(API_URL, headers=cache.conditional_headers())
+        if resp.status_code == 304 and cache.syncs is not None:
+            return FetchResult(cache.syncs, cache.wallet, False, True)
         resp.raise_for_status()
-        data: Dict[str, Any] = resp.json()
+        # Fallback for servers without validators: compare a body digest.
+        digest = hashlib.sha1(resp.content).hexdigest()
+        if digest == cache.digest and cache.syncs is not None:
+            return FetchResult(cache.syncs, cache.wallet, False, True)
+        data: Dict[str, Any] = json_loads(resp.content)
         if data.get("success"):
-            return data.get("synchronizers", []), data.get("owner", {}).get("walletAddress")
+            cache.etag = resp.headers.get("ETag")
+            cache.last_modified = resp.headers.get("Last-Modified")
+            cache.digest = digest
+            syncs = [_project(sync) for sync in data.get("synchronizers", [])]
+            syncs.sort(key=_SYNC_SORT_KEY)
+            cache.syncs = syncs
+            cache.wallet = data.get("owner", {}).get("walletAddress")
+            cache.save()
+            return FetchResult(cache.syncs, cache.wallet, True, True)
     except Exception as exc:  # pragma: no cover
         print(f"[fetch] {type(exc).__name__}: {exc}", file=sys.stderr)
-    return [], None
+    if cache.syncs is not None:
+        return FetchResult(cache.syncs, cache.wallet, False, False)
+    return FetchResult([], None, False, False)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Widgets
@@ -62,31 +188,53 @@ class SynchronizerWidget(Static):
     """One synchronizer card – visual style via CSS (.widget-base)."""
 
     data: reactive[Dict[str, Any]] = reactive({})
+    _card: RenderableType | None = None  # instance attr only once rendered
 
     def __init__(self, sync: Dict[str, Any]):
         super().__init__(classes="widget-base")
         self.data = sync
 
+    def watch_data(self, data: Dict[str, Any]) -> None:
+        # Drop the cached card; the reactive's repaint rebuilds it once.
+        self._card = None
+
     def render(self) -> RenderableType:
+        if self._card is None:
+            self._card = self._build(self.data)
+        return self._card
+
+    @staticmethod
+    def _build(data: Dict[str, Any]) -> RenderableType:
         table = Table.grid(padding=(0, 1))
         table.add_column(justify="right")
         table.add_column()
-        for field in ("id", "key", "name", "isEnabled"):
-            table.add_row(f"[bold]{field}[/]", str(self.data.get(field, "—")))
+        for field, label in _FIELDS:
+            value = data.get(field)
+            # Text cells skip markup parsing, so values render verbatim
+            table.add_row(label, Text("—" if value is None or value == "" else str(value)))
         return table
 
 
 class FooterBar(Static):
     """Static footer bar with live countdown (inherits CSS colours)."""
 
-    remaining: reactive[int] = reactive(REFRESH_EVERY)
+    # update() in the watchers repaints, so the reactives themselves do not
+    remaining: reactive[int] = reactive(REFRESH_EVERY, repaint=False)
+    stale: reactive[bool] = reactive(False, repaint=False)  # showing last good data
 
     def __init__(self) -> None:
-        super().__init__(classes="widget-base footer")
-        self.styles.text_align = "center"
+        super().__init__(self._label(REFRESH_EVERY, False), markup=False, classes="widget-base footer")
 
-    def render(self) -> RenderableType:
-        return f"Auto‑refresh in: {self.remaining}s  •  Press Q to quit"
+    @staticmethod
+    def _label(remaining: int, stale: bool) -> str:
+        status = "  •  Stale (last fetch failed)" if stale else ""
+        return f"Auto‑refresh in: {remaining}s{status}  •  Press Q to quit"
+
+    def watch_remaining(self, remaining: int) -> None:
+        self.update(self._label(remaining, self.stale))
+
+    def watch_stale(self, stale: bool) -> None:
+        self.update(self._label(self.remaining, stale))
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Application
@@ -98,8 +246,25 @@ class Dashboard(App):
     def __init__(self, key: str):
         super().__init__()
         self.key = key
-        self.client = httpx.AsyncClient(http2=True, verify=True)
-        self.next_refresh_epoch = time.time() + REFRESH_EVERY
+        # Keep one warm connection across polls, including backed-off ones
+        self.client = httpx.AsyncClient(
+            http2=True,
+            verify=True,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=REFRESH_MAX + REFRESH_EVERY),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            headers={"X-Enterprise-API-Key": key, "Content-Type": "application/json"},
+        )
+        self._cache = SyncCache(key)
+        # Adaptive refresh: back off while the shown synchronizers stay the same
+        self._shown_syncs: List[Dict[str, Any]] | None = None
+        self._unchanged_streak = 0
+        self._refresh_timer: Timer | None = None
+        # At most one refresh in flight; overlapping triggers set the flag
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_pending = False
+        # Monotonic loop clock, captured in on_mount
+        self._monotonic: Callable[[], float]
+        self.next_refresh_at = 0.0
         # Will be assigned in on_mount
         self.header: Static | TextualHeader
         self.body: VerticalScroll
@@ -113,6 +278,10 @@ class Dashboard(App):
     # ------------------------------------------------------------------
     async def on_mount(self) -> None:
         """Compose layout and start timers."""
+        self._monotonic = asyncio.get_running_loop().time
+        # First fetch overlaps with composing the layout below
+        fetch_task = asyncio.create_task(fetch_synchronizers(self.client, self._cache))
+
         # Header
         if TextualHeader is not None:
             self.title = APP_TITLE
@@ -121,34 +290,69 @@ class Dashboard(App):
                 self.header.styles.title_align = "center"  # type: ignore[attr-defined]
         else:
             self.header = Static(APP_TITLE, classes="widget-base header")
-            self.header.styles.text_align = "center"
-        await self.mount(self.header)
 
         # Body
         self.body = VerticalScroll(id="scroll-view")
-        await self.mount(self.body)
 
         # Footer (always static to ensure colour scheme and countdown)
         self.footer = FooterBar()
-        await self.mount(self.footer)
+
+        await self.mount(self.header, self.body, self.footer)
         self._set_footer_countdown(REFRESH_EVERY)
 
         # Initial data & timers
-        await self.refresh_widgets()
-        self.set_interval(REFRESH_EVERY, self.refresh_widgets)
+        async with self._refresh_lock:
+            await self._apply_fetch(await fetch_task)
+        self._queue_pending_refresh()
         self.set_interval(1.0, self._tick)
 
     # ------------------------------------------------------------------
-    async def refresh_widgets(self) -> None:
-        """Fetch data and rebuild widget grid."""
-        syncs, wallet = await fetch_synchronizers(self.client, self.key)
-        # Sort synchronizers by 'name' (change 'name' to another key if needed)
-        syncs = sorted(syncs, key=lambda s: s.get("name", ""))
+    async def refresh_widgets(self, backoff: bool = False) -> None:
+        """Run one refresh; triggers arriving meanwhile collapse into one follow-up.
+
+        Only the refresh timer passes backoff=True, so only its polls count
+        towards the unchanged streak."""
+        if self._refresh_lock.locked():
+            self._refresh_pending = True
+            return
+        async with self._refresh_lock:
+            await self._apply_fetch(await fetch_synchronizers(self.client, self._cache), backoff)
+        self._queue_pending_refresh()
+
+    def _queue_pending_refresh(self) -> None:
+        """Run one follow-up for triggers that arrived during a locked refresh."""
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.call_later(self.refresh_widgets)
+
+    async def _apply_fetch(self, result: FetchResult, backoff: bool = False) -> None:
+        """Rebuild widget grid from *result* (skipped when nothing changed)."""
+        syncs, wallet, ok = result.syncs, result.wallet, result.ok
+        self.footer.stale = not ok
         self._update_header_wallet(wallet)
-        await self._clear_body()
-        await self._populate_sync_rows(syncs)
-        self.next_refresh_epoch = time.time() + REFRESH_EVERY
-        self._set_footer_countdown(REFRESH_EVERY)
+        # Projected lists are already sorted, so plain equality finds changes;
+        # a reused cached payload is the very same list and short-circuits.
+        unchanged = syncs is self._shown_syncs or syncs == self._shown_syncs
+        self._shown_syncs = syncs
+        if unchanged:
+            # Failed fetches retry at the base rate instead of backing off
+            if not ok:
+                self._unchanged_streak = 0
+            elif backoff:
+                self._unchanged_streak += 1
+        else:
+            self._unchanged_streak = 0
+            await self._reconcile_sync_rows(syncs)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Arm the next refresh: REFRESH_EVERY doubled per unchanged poll, capped."""
+        delay = min(REFRESH_EVERY * 2 ** self._unchanged_streak, REFRESH_MAX)
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(delay, partial(self.refresh_widgets, backoff=True))
+        self.next_refresh_at = self._monotonic() + delay
+        self._set_footer_countdown(delay)
 
     def _update_header_wallet(self, wallet: str | None) -> None:
         """Update wallet in header if supported."""
@@ -156,28 +360,44 @@ class Dashboard(App):
             if hasattr(self.header, "sub_title"):
                 self.header.sub_title = wallet or ""
 
-    async def _clear_body(self) -> None:
-        """Remove all widgets from the body."""
-        for child in list(self.body.children):
-            await child.remove()
+    async def _reconcile_sync_rows(self, syncs: list[dict]) -> None:
+        """Reuse cards by position; mount or remove only at the tail.
+
+        Every card is the same widget class, so slot *i* simply receives
+        syncs[i]. Unchanged data does not repaint (the reactive compares
+        values), and an insert or delete anywhere costs one mount or removal
+        at the end rather than rebuilding the rows after it."""
+        rows = list(self.body.children)
+        chunks = list(batched(syncs, CARDS_PER_ROW))
+        for row, chunk in zip(rows, chunks):
+            cards = list(row.children)
+            for card, sync in zip(cards, chunk):
+                card.data = sync
+            # Only the last row can be partial, so at most a couple of cards here
+            if len(chunk) > len(cards):
+                await row.mount(*[SynchronizerWidget(sync) for sync in chunk[len(cards):]])
+            for card in cards[len(chunk):]:
+                await card.remove()
+        if len(chunks) > len(rows):
+            await self._populate_sync_rows(syncs[len(rows) * CARDS_PER_ROW:])
+        for row in rows[len(chunks):]:
+            await row.remove()
+
+    def _build_row(self, chunk: tuple[dict, ...]) -> Horizontal:
+        """Unmounted row holding one card per sync in *chunk* (styled by .row)."""
+        return Horizontal(*[SynchronizerWidget(sync) for sync in chunk], classes="row")
 
     async def _populate_sync_rows(self, syncs: list[dict]) -> None:
-        """Add synchronizer widgets in rows of up to 3."""
-        row = None
-        for idx, sync in enumerate(syncs):
-            if idx % 3 == 0:
-                row = Horizontal(classes="row")
-                row.styles.flex_wrap = "wrap"
-                row.styles.gap = (1, 1)
-                await self.body.mount(row)
-            widget = SynchronizerWidget(sync)
-            widget.styles.width = "1fr"
-            if row:
-                await row.mount(widget)
+        """Append synchronizer widgets in rows of up to 3 with a single mount."""
+        rows = [self._build_row(chunk) for chunk in batched(syncs, CARDS_PER_ROW)]
+        if rows:
+            await self.body.mount(*rows)
 
     # ------------------------------------------------------------------
     async def _tick(self) -> None:
-        remaining = max(0, int(self.next_refresh_epoch - time.time()))
+        remaining = max(0, int(self.next_refresh_at - self._monotonic()))
+        if remaining == self.footer.remaining:
+            return
         self._set_footer_countdown(remaining)
 
     async def on_unmount(self) -> None:
@@ -191,7 +411,12 @@ def main(argv: List[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Synchronizer dashboard (Textual)")
     parser.add_argument("--key", required=True, help="Enterprise API key")
     args = parser.parse_args(argv)
-    Dashboard(args.key).run()
+    try:  # libuv-based event loop, where available (not on Windows)
+        import uvloop
+    except ImportError:
+        Dashboard(args.key).run()
+    else:
+        Dashboard(args.key).run(loop=uvloop.new_event_loop())
 
 if __name__ == "__main__":
     try: